@@ -1,12 +1,16 @@
-import json
 import os
+import sys
+import threading
 from flask import Flask, render_template, request, redirect, url_for
 from flask import send_from_directory
+
+# Make the repo root importable so the technician store is shared with app.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tech_store import load_technicians, save_technicians
+
 DOWNLOADS_DIR = os.path.join(os.environ['USERPROFILE'], 'Downloads')  # For Windows
 app = Flask(__name__)
 
-# Path to the JSON file for storing technician data
-TECHNICIAN_FILE = "admin_page/technicians.json"
 PDF_DIR = os.path.join(os.path.dirname(__file__), 'static', 'pdfs')
 os.makedirs(PDF_DIR, exist_ok=True)
 
@@ -14,22 +18,22 @@ os.makedirs(PDF_DIR, exist_ok=True)
 
 
 
-def load_technicians():
-    """Load technician data from the JSON file."""
-    try:
-        with open(TECHNICIAN_FILE, "r") as file:
-            data = json.load(file)
-        print("Loaded Technicians:", data.get("technicians", []))  # Debug log
-        return data.get("technicians", [])
-    except FileNotFoundError:
-        print("technicians.json not found!")  # Debug log
-        return []
+# Cache of the Downloads PDF listing, invalidated when the directory's mtime changes
+_pdf_cache = {"mtime": None, "files": []}
+_pdf_cache_lock = threading.Lock()
+
 
-def save_technicians(technicians):
-    """Save the list of technicians to the JSON file."""
-    with open(TECHNICIAN_FILE, "w") as file:
-        json.dump({"technicians": technicians}, file, indent=4)
-    print("Saved Technicians:", technicians)  # Debug log
+def list_pdfs():
+    """Return the PDF filenames in Downloads (cached until the directory changes)."""
+    st = os.stat(DOWNLOADS_DIR)
+    with _pdf_cache_lock:
+        if st.st_mtime_ns == _pdf_cache["mtime"]:
+            return _pdf_cache["files"]
+        with os.scandir(DOWNLOADS_DIR) as it:
+            pdf_files = [e.name for e in it if e.is_file(follow_symlinks=False) and e.name.endswith('.pdf')]
+        _pdf_cache["mtime"] = st.st_mtime_ns
+        _pdf_cache["files"] = pdf_files
+        return pdf_files
 
 
 @app.route('/')
@@ -44,8 +48,7 @@ def admin_dashboard():
     total_technicians = len(technicians)  # Count technicians
 
     try:
-        pdf_files = [f for f in os.listdir(DOWNLOADS_DIR) if f.endswith('.pdf')]
-        total_pdfs = len(pdf_files)  # Count PDF files
+        total_pdfs = len(list_pdfs())  # Count PDF files
     except Exception as e:
         print("Error reading PDF files:", e)
         total_pdfs = 0
@@ -101,7 +104,7 @@ def delete_technician():
 def manage_pdf():
     """Render the Manage PDF Files page with the list of files from the Downloads folder."""
     try:
-        pdf_files = [f for f in os.listdir(DOWNLOADS_DIR) if f.endswith('.pdf')]
+        pdf_files = list_pdfs()
         print("PDF Files Found in Downloads:", pdf_files)  # Debugging
         return render_template('managePDF.html', pdf_files=pdf_files)
     except Exception as e:
@@ -121,6 +124,8 @@ def delete_pdf():
         file_path = os.path.join(DOWNLOADS_DIR, filename)
         if os.path.exists(file_path):
             os.remove(file_path)
+            with _pdf_cache_lock:
+                _pdf_cache["mtime"] = None  # Force a re-scan on next listing
     return redirect(url_for('manage_pdf'))
 
 
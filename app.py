@@ -1,19 +1,27 @@
 import os  # For managing file paths and environment variables
-import json  # For working with JSON data
+import orjson  # Fast JSON serialization (returns/accepts bytes directly)
 from flask import Flask, render_template, request, send_file, jsonify  # Flask for web handling
 from io import BytesIO  # In-memory file management
 from PIL import Image  # For image handling
 import fitz  # PyMuPDF for PDF processing
 import base64  # For decoding base64 strings
 import requests  # For interacting with APIs (e.g., Google Sheets)
-from textblob import TextBlob  # For AI-based spell checking
-import shutil  # Add this import at the top of your code
+from requests.adapters import HTTPAdapter  # Connection pooling for the Sheets session
+from symspellpy import SymSpell  # Precomputed-index spell checking
+import importlib.resources  # Locates symspellpy's bundled dictionary
+from functools import lru_cache  # Memoizes DO number existence checks
+from concurrent.futures import ThreadPoolExecutor  # Background Sheets submissions
+from tech_store import load_technicians  # Shared technician cache (see tech_store.py)
+import time  # TTL bookkeeping for the DO number cache
 
 
 # Ensure compatibility across environments (Windows/Linux)
 DOWNLOADS_DIR = os.path.join(os.environ.get('USERPROFILE') or os.environ.get('HOME') or '/tmp', 'Downloads')
 os.makedirs(DOWNLOADS_DIR, exist_ok=True)  # Create the directory if it doesn't exist
 
+# Generated reports by DO No., so re-downloads skip regeneration
+_PDF_INDEX = {}
+
 # Flask app initialization
 app = Flask(__name__)
 
@@ -23,41 +31,67 @@ app = Flask(__name__)
 # Path to the static PDF template file
 TEMPLATE_PATH = os.path.join(app.root_path, 'static', 'SDO_report_web.pdf')
 
-# Paths for writable output files (compatible with Render's environment)
-OUTPUT_TEMP_PATH = os.path.join('/tmp', 'output_temp.pdf')  # Temporary output for PDF merging
-OUTPUT_PATH = os.path.join('/tmp', 'filled_SDO_report.pdf')  # Final filled PDF
-
-# Directory for storing signatures temporarily
-SIGNATURE_DIR = os.path.join('/tmp', 'signatures')
-os.makedirs(SIGNATURE_DIR, exist_ok=True)  # Create if it doesn't exist
+# Read the template once at import; each request opens it from memory
+with open(TEMPLATE_PATH, "rb") as _f:
+    _TEMPLATE_BYTES = _f.read()
 
 # Path to track DO numbers locally
 DO_NO_FILE = os.path.join(app.root_path, 'do_no.txt')
 
-# Path to technician data JSON file
-TECHNICIAN_FILE = os.path.join(app.root_path, "admin_page", "technicians.json")
-
 # Google Sheets Web App URL for integration
 GOOGLE_SHEET_WEB_APP_URL = (
     "https://script.google.com/macros/s/AKfycbyfYgiOYjHPfDtk1sJm7iS8UPTNVEkXKgpqZ8DRhYNQRH9dH0ki7Ppx3rgvfjuSB54O/exec"
 )
 
+# Spell checker loaded once at import; the bundled English frequency
+# dictionary makes per-request lookups effectively instant
+_sym_spell = SymSpell(max_dictionary_edit_distance=2, prefix_length=7)
+_DICTIONARY_PATH = importlib.resources.files("symspellpy") / "frequency_dictionary_en_82_765.txt"
+_sym_spell.load_dictionary(str(_DICTIONARY_PATH), term_index=0, count_index=1)
+
+# Shared session so repeated Sheets calls reuse the same TCP+TLS connection
+SHEETS = requests.Session()
+SHEETS.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+SHEETS_TIMEOUT = (3, 10)  # (connect, read) seconds — don't hang the request thread
+
+# Background workers so /submit doesn't block on the Sheets round-trip
+_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
 
-def load_technicians():
-    """Load technician data from the JSON file."""
+def _log_sheets_result(future):
+    """Done-callback that surfaces background Sheets failures in the log."""
     try:
-        with open(TECHNICIAN_FILE, "r") as file:
-            data = json.load(file)
-        return data.get("technicians", [])
-    except FileNotFoundError:
-        return []
+        response = future.result()
+        print(f"Response from Google Sheets: {response.status_code}, {response.text}")
+        if response.status_code != 200:
+            print(f"Error: Google Sheets rejected submission: {response.text}")
+    except Exception as e:
+        print(f"Error sending data to Google Sheets: {e}")
+
+
+# Short-lived cache of the next DO number so rendering '/' doesn't hit
+# Google Sheets on every request
+_do_cache = {"value": None, "ts": 0.0}
+_DO_CACHE_TTL = 60  # seconds
+
+# Parsed set of taken DO numbers, reused briefly between fetches
+_do_numbers_cache = {"numbers": None, "ts": 0.0}
+_DO_NUMBERS_TTL = 30  # seconds
 
 
 def get_next_do_no():
     """Fetch the next available DO No. by checking Google Sheets."""
+    if _do_cache["value"] is not None and time.monotonic() - _do_cache["ts"] < _DO_CACHE_TTL:
+        return _do_cache["value"]
+    # A recently fetched numbers set can answer without another round-trip
+    if _do_numbers_cache["numbers"] is not None and time.monotonic() - _do_numbers_cache["ts"] < _DO_NUMBERS_TTL:
+        next_number = 1001
+        while next_number in _do_numbers_cache["numbers"]:
+            next_number += 1
+        return next_number
     try:
         # Fetch all existing DO numbers from Google Sheets
-        response = requests.get(GOOGLE_SHEET_WEB_APP_URL, params={"action": "get_all_do_no"})
+        response = SHEETS.get(GOOGLE_SHEET_WEB_APP_URL, params={"action": "get_all_do_no"}, timeout=SHEETS_TIMEOUT)
         print(f"Request URL: {response.url}")  # Debugging: Log request URL
         print(f"Response Status Code: {response.status_code}")  # Debugging: Log status code
         print(f"Response Text: {response.text}")  # Debugging: Log response text
@@ -71,14 +105,17 @@ def get_next_do_no():
                 if not isinstance(existing_numbers, list):
                     raise ValueError("Expected a list in 'numbers'")
 
-                # Ensure all items are integers
-                existing_numbers = [int(num) for num in existing_numbers]
-                existing_numbers.sort()
+                # Set membership is O(1), so the scan below stays linear
+                existing_numbers = {int(num) for num in existing_numbers}
+                _do_numbers_cache["numbers"] = existing_numbers
+                _do_numbers_cache["ts"] = time.monotonic()
 
                 # Find the first available number
                 next_number = 1001
                 while next_number in existing_numbers:
                     next_number += 1
+                _do_cache["value"] = next_number
+                _do_cache["ts"] = time.monotonic()
                 return next_number
             except (ValueError, TypeError) as e:
                 print(f"Error processing JSON response: {e}")
@@ -91,10 +128,11 @@ def get_next_do_no():
         return 1001
 
 
+@lru_cache(maxsize=512)
 def check_number_in_google_sheets(do_no):
-    """Checks if the given DO No. already exists in Google Sheets."""
+    """Checks if the given DO No. already exists in Google Sheets (memoized)."""
     try:
-        response = requests.get(GOOGLE_SHEET_WEB_APP_URL, params={"action": "check_do_no", "do_no": do_no})
+        response = SHEETS.get(GOOGLE_SHEET_WEB_APP_URL, params={"action": "check_do_no", "do_no": do_no}, timeout=SHEETS_TIMEOUT)
         if response.status_code == 200:
             result = response.json()  # Parse the JSON response
             return result.get("exists", False)
@@ -128,9 +166,9 @@ def spellcheck():
         if not text.strip():
             return jsonify({'corrected': text})  # Return original text if empty
 
-        # Use TextBlob for spell-checking
-        blob = TextBlob(text)
-        corrected_text = str(blob.correct())  # Correct the entire sentence
+        # SymSpell's compound lookup corrects the whole sentence at once
+        suggestions = _sym_spell.lookup_compound(text, max_edit_distance=2)
+        corrected_text = suggestions[0].term if suggestions else text
         return jsonify({'corrected': corrected_text})
     except Exception as e:
         return jsonify({'corrected': None}), 500
@@ -142,31 +180,23 @@ def submit():
     Handles form submission, generates PDF, and sends data to Google Sheets.
     """
     try:
-        # Step 1: Collect and organize form data
-        form_data = {
-            "SDO #": request.form.get("sdo_no", "0000"),
-            "Project Site": request.form.get("project_site", "").strip(),
-            "DO No.": request.form.get("do_no", "").strip(),
-            "Date": request.form.get("date", "").strip(),
-            "Technician": request.form.get("technician", "").strip(),
-            "Check In-Time": request.form.get("check_in_time", "").strip(),
-            "Check Out-Time": request.form.get("check_out_time", "").strip(),
-            "Task Objectives": request.form.get("task_objectives", "").strip(),
-            "System Type": request.form.getlist("system_type"),
-            "Type": request.form.getlist("type"),
-            "Materials": request.form.get("materials", "").strip(),
-            "Special Instructions": request.form.get("special_instructions", "").strip(),
-            "Reported by Name": request.form.get("reported_by", "").strip(),
-            "Reported Date": request.form.get("date", "").strip(),
-            "Client's Signature Name": request.form.get("client_name", "").strip(),
-            "Client's Position": request.form.get("position", "").strip(),
-        }
-
-        # Collect scope data dynamically
-        for i in range(1, 7):
-            form_data[f"Scope {i} Location"] = request.form.get(f"scope_{i}_location", "").strip()
-            form_data[f"Scope {i} Status"] = request.form.get(f"scope_{i}_status", "").strip()
-            form_data[f"Scope {i} Description"] = request.form.get(f"scope_{i}_description", "").strip()
+        # Step 1: Collect and organize form data in a single pass over the form
+        form_data = {name: "" for targets in _FIELD_MAP.values() for name in targets}
+        form_data.update(dict.fromkeys(_SCOPE_FIELD_MAP.values(), ""))
+        form_data["SDO #"] = "0000"
+
+        for key, value in request.form.items():
+            targets = _FIELD_MAP.get(key)
+            if targets:
+                value = value.strip()
+                for name in targets:
+                    form_data[name] = value
+            elif key in _SCOPE_FIELD_MAP:
+                form_data[_SCOPE_FIELD_MAP[key]] = value.strip()
+
+        # Multi-valued checkbox fields
+        form_data["System Type"] = request.form.getlist("system_type")
+        form_data["Type"] = request.form.getlist("type")
 
         # Validate required fields
         required_fields = ["DO No.", "Project Site", "Date", "Technician"]
@@ -174,14 +204,17 @@ def submit():
         if missing_fields:
             return f"Error: Missing required fields: {', '.join(missing_fields)}", 400
 
-        # Step 2: Generate the overlay PDF and merge with template
-        overlay_pdf = create_overlay_pdf(form_data)
-        merge_pdfs_with_images(overlay_pdf, TEMPLATE_PATH, OUTPUT_TEMP_PATH, request.files, form_data)
-        add_signatures_to_pdf(
-            OUTPUT_TEMP_PATH,
-            OUTPUT_PATH,
+        # Step 2: Generate the overlay PDF and merge with template,
+        # writing the signed result straight into Downloads
+        pdf_filename = f"{form_data['DO No.']}_filled_SDO_report.pdf"
+        pdf_path = os.path.join(DOWNLOADS_DIR, pdf_filename)
+
+        build_report(
+            form_data,
+            request.files,
             request.form.get("reported_by_signature"),
-            request.form.get("client_signature")
+            request.form.get("client_signature"),
+            pdf_path
         )
 
         # Step 3: Prepare data for Google Sheets
@@ -200,82 +233,153 @@ def submit():
         print(f"Google Sheet Data: {google_sheet_data}")
         headers = {"Content-Type": "application/json"}
 
-        # Step 4: Send data to Google Sheets
-        response = requests.post(GOOGLE_SHEET_WEB_APP_URL, json=google_sheet_data)
+        # Step 4: Send data to Google Sheets in the background so the user
+        # gets the PDF immediately; failures are logged by the done-callback
+        body = orjson.dumps(google_sheet_data)
+        future = _EXECUTOR.submit(
+            SHEETS.post, GOOGLE_SHEET_WEB_APP_URL, data=body, headers=headers, timeout=SHEETS_TIMEOUT
+        )
+        future.add_done_callback(_log_sheets_result)
         print(f"Sending data to Google Sheets: {google_sheet_data}")
-        print(f"Response from Google Sheets: {response.status_code}, {response.text}")
 
-        if response.status_code != 200:
-            return f"Error: Failed to send data to Google Sheets. Response: {response.text}", 500
+        # The submitted number is now taken; advance the cached next DO No.
+        try:
+            _do_cache["value"] = int(form_data["DO No."]) + 1
+            _do_cache["ts"] = time.monotonic()
+        except ValueError:
+            _do_cache["value"] = None  # Non-numeric DO No.; refetch next time
+        _do_numbers_cache["numbers"] = None  # Stale: the sheet just gained a row
+        check_number_in_google_sheets.cache_clear()
 
-        # Save the filled PDF in the Downloads directory
-        pdf_filename = f"{form_data['DO No.']}_filled_SDO_report.pdf"
-        pdf_path = os.path.join(DOWNLOADS_DIR, pdf_filename)
-
-        # Use shutil.move instead of os.rename to avoid cross-device link errors
-        shutil.move(OUTPUT_PATH, pdf_path)
+        # Remember where this DO No.'s report lives for later re-downloads
+        _PDF_INDEX[form_data["DO No."]] = pdf_path
 
-        # Return the filled PDF
+        # Return the filled PDF (already saved in the Downloads directory);
+        # conditional responses let repeat downloads answer with 304
         return send_file(
             pdf_path,
             as_attachment=True,
             download_name=pdf_filename,
-            mimetype="application/pdf"
+            mimetype="application/pdf",
+            conditional=True,
+            etag=True,
+            last_modified=os.path.getmtime(pdf_path)
         )
     except Exception as e:
         print(f"Error during form submission: {e}")
         return f"Error: Could not process the form submission. Details: {e}", 500
 
 
-    # Serve the filled PDF to the user
-    return send_file(OUTPUT_PATH, as_attachment=True, download_name='filled_SDO_report.pdf', mimetype='application/pdf')
+# Form key -> output field name(s); "date" feeds both Date fields
+_FIELD_MAP = {
+    "sdo_no": ("SDO #",),
+    "project_site": ("Project Site",),
+    "do_no": ("DO No.",),
+    "date": ("Date", "Reported Date"),
+    "technician": ("Technician",),
+    "check_in_time": ("Check In-Time",),
+    "check_out_time": ("Check Out-Time",),
+    "task_objectives": ("Task Objectives",),
+    "materials": ("Materials",),
+    "special_instructions": ("Special Instructions",),
+    "reported_by": ("Reported by Name",),
+    "client_name": ("Client's Signature Name",),
+    "position": ("Client's Position",),
+}
+
+# scope_<i>_<part> form keys -> "Scope <i> <Part>" output fields
+_SCOPE_FIELD_MAP = {
+    f"scope_{i}_{part}": f"Scope {i} {part.capitalize()}"
+    for i in range(1, 7)
+    for part in ("location", "status", "description")
+}
+
+
+# ------------------------------
+# PDF layout constants (module-level so no per-request rebuilding)
+# ------------------------------
+# Coordinates for each field on the PDF template
+_COORDS = {
+    "SDO #": (620, 20),
+    "Project Site": (160, 113),
+    "DO No.": (165, 132),
+    "Technician": (160, 145),
+    "Task Objectives": (149, 161),
+    "Date": (510, 115),
+    "Check In-Time": (510, 131),
+    "Check Out-Time": (510, 146),
+    "Materials": (50, 690),
+    "Special Instructions": (50, 750),
+
+    "Reported by Name": (430, 744),
+    "Reported Date": (430, 755),
+    "Client's Signature Name": (531, 744),
+    "Client's Position": (531, 755)
+}
+
+# Checkbox coordinates for System Types
+_SYSTEM_POS = {
+    "CCTV": (116, 169),
+    "Door Access": (152, 170),
+    "Lift Access": (210, 170),
+    "Barrier Gate": (263, 170),
+    "Intercom": (320, 170),
+    "Networking": (364, 170),
+    "Others": (418, 170)
+}
+
+# Checkbox coordinates for Types (Service, Installation, Maintenance)
+_TYPE_POS = {
+    "Service": (530, 53),
+    "Installation": (540, 68),
+    "Maintenance": (550, 81)
+}
+
+# Scope image rectangles on the report page
+_IMAGE_POSITIONS = (
+    (60, 220, 190, 325),   # Scope 1
+    (250, 220, 380, 325),  # Scope 2
+    (430, 220, 560, 325),  # Scope 3
+    (60, 435, 190, 540),   # Scope 4
+    (250, 435, 380, 540),  # Scope 5
+    (430, 435, 560, 540),  # Scope 6
+)
+
+# Location/status text anchors for each scope
+_SCOPE_TEXT = (
+    {"location": (130, 193), "status": (130, 203)},  # Scope 1
+    {"location": (295, 193), "status": (295, 203)},  # Scope 2
+    {"location": (475, 193), "status": (475, 203)},  # Scope 3
+    {"location": (130, 404), "status": (130, 416)},  # Scope 4
+    {"location": (295, 404), "status": (295, 416)},  # Scope 5
+    {"location": (475, 404), "status": (475, 416)},  # Scope 6
+)
+
+
+@app.route('/download/<do_no>')
+def download_report(do_no):
+    """Serve an already-generated report for the given DO No. without rebuilding it."""
+    pdf_path = _PDF_INDEX.get(do_no)
+    if not pdf_path or not os.path.exists(pdf_path):
+        return f"Error: No generated report found for DO No. {do_no}", 404
+    return send_file(
+        pdf_path,
+        as_attachment=True,
+        download_name=os.path.basename(pdf_path),
+        mimetype="application/pdf",
+        conditional=True,
+        etag=True,
+        last_modified=os.path.getmtime(pdf_path)
+    )
 
 
 def create_overlay_pdf(data):
-    """Creates an overlay PDF with form data and returns it as a BytesIO object."""
-    buffer = BytesIO()
+    """Creates an overlay PDF with form data and returns it as bytes."""
     doc = fitz.open()  # Create a new PDF
     page = doc.new_page(width=595, height=842)  # Standard A4 size
 
-    # Coordinates for each field on the PDF template
-    coordinates = {
-        "SDO #": (620, 20),
-        "Project Site": (160, 113),
-        "DO No.": (165, 132),
-        "Technician": (160, 145),
-        "Task Objectives": (149, 161),
-        "Date": (510, 115),
-        "Check In-Time": (510, 131),
-        "Check Out-Time": (510, 146),
-        "Materials": (50, 690),
-        "Special Instructions": (50, 750),
-        
-        "Reported by Name": (430, 744),
-        "Reported Date": (430, 755),
-        "Client's Signature Name": (531, 744),
-        "Client's Position": (531, 755)
-    }
-
-    # Checkbox coordinates for System Types
-    system_type_positions = {
-        "CCTV": (116, 169),
-        "Door Access": (152, 170),
-        "Lift Access": (210, 170),
-        "Barrier Gate": (263, 170),
-        "Intercom": (320, 170),
-        "Networking": (364, 170),
-        "Others": (418, 170)
-    }
-
-    # Updated Checkbox coordinates for Types (Service, Installation, Maintenance)
-    type_positions = {
-        "Service": (530, 53),
-        "Installation": (540, 68),
-        "Maintenance": (550, 81)
-    }
-
     # Insert text data for basic fields
-    for field, coord in coordinates.items():
+    for field, coord in _COORDS.items():
         text = data.get(field, "")
         if text:
             font_size = 8 if "Scope" in field else 10
@@ -283,25 +387,23 @@ def create_overlay_pdf(data):
 
     # Insert checkmarks for selected system types
     for item in data.get("System Type", []):
-        if item in system_type_positions:
-            x, y = system_type_positions[item]
+        if item in _SYSTEM_POS:
+            x, y = _SYSTEM_POS[item]
             page.insert_text((x + 2, y), "/", fontsize=8)
 
     # Insert checkmarks for selected service types
     for item in data.get("Type", []):
-        if item in type_positions:
-            x, y = type_positions[item]
+        if item in _TYPE_POS:
+            x, y = _TYPE_POS[item]
             page.insert_text((x + 2, y), "/", fontsize=8)
 
-    # Save overlay PDF to buffer
-    doc.save(buffer)
-    buffer.seek(0)
-    return buffer
+    # Serialize the overlay PDF once, straight to bytes
+    return doc.tobytes()
 
-def save_signature_image(base64_string, filename):
-    """Saves a base64-encoded signature as a PNG file with a transparent background."""
+def decode_signature_image(base64_string, label):
+    """Decodes a base64-encoded signature into transparent PNG bytes."""
     if not base64_string:
-        print(f"No Base64 string provided for {filename}")
+        print(f"No Base64 string provided for {label}")
         return None
 
     if "," in base64_string:
@@ -314,54 +416,52 @@ def save_signature_image(base64_string, filename):
         base64_data += '=' * (4 - missing_padding)
 
     try:
-        image_data = BytesIO(base64.b64decode(base64_data))
-        signature = Image.open(image_data).convert("RGBA")
+        raw = base64.b64decode(base64_data)
+
+        # Canvas signatures are already PNGs with alpha — use them as-is
+        # and let fitz decode natively, skipping the PIL round-trip
+        if raw.startswith(b"\x89PNG\r\n\x1a\n"):
+            return raw
 
+        # Fallback for non-PNG payloads: composite onto a transparent canvas
+        signature = Image.open(BytesIO(raw)).convert("RGBA")
         transparent_bg = Image.new("RGBA", signature.size, (255, 255, 255, 0))
         transparent_bg.paste(signature, (0, 0), signature)
 
-        file_path = os.path.join(SIGNATURE_DIR, filename)
-        transparent_bg.save(file_path, "PNG")
-
-        print(f"Signature saved at {file_path}")  # Debug statement
-        return file_path
+        png_buffer = BytesIO()
+        transparent_bg.save(png_buffer, "PNG")
+        return png_buffer.getvalue()
     except Exception as e:
-        print(f"Error decoding Base64 string for {filename}: {e}")
+        print(f"Error decoding Base64 string for {label}: {e}")
         return None
 
 
-def merge_pdfs_with_images(overlay_pdf, template_path, output_temp_path, files, form_data):
-    template = fitz.open(template_path)
-    overlay = fitz.open(stream=overlay_pdf.getvalue(), filetype="pdf")
+def build_report(form_data, files, reported_by_signature, client_signature, output_path):
+    """Builds the filled report in one pass: overlay, scope images and
+    signatures are all applied to the in-memory template, then saved once."""
+    template = fitz.open(stream=_TEMPLATE_BYTES, filetype="pdf")
+    overlay = fitz.open(stream=create_overlay_pdf(form_data), filetype="pdf")
     template[0].show_pdf_page(template[0].rect, overlay, 0)
 
-    image_positions = [
-        (60, 220, 190, 325),  # Scope 1
-        (250, 220, 380, 325),  # Scope 2
-        (430, 220, 560, 325),  # Scope 3
-        (60, 435, 190, 540),   # Scope 4
-        (250, 435, 380, 540),  # Scope 5
-        (430, 435, 560, 540),  # Scope 6
-    ]
-
-    scope_text_positions = [
-        {"location": (130, 193), "status": (130, 203)},  # Scope 1
-        {"location": (295, 193), "status": (295, 203)},  # Scope 2
-        {"location": (475, 193), "status": (475, 203)},  # Scope 3
-        {"location": (130, 404), "status": (130, 416)},  # Scope 4
-        {"location": (295, 404), "status": (295, 416)},  # Scope 5
-        {"location": (475, 404), "status": (475, 416)},  # Scope 6
-    ]
-
-    for i in range(1, 7):
+    for i, (x0, y0, x1, y1) in enumerate(_IMAGE_POSITIONS, start=1):
         image_file = files.get(f"scope_{i}_image")
         if image_file:
-            img = Image.open(image_file).resize((130, 130), Image.LANCZOS)
-            img_stream = BytesIO()
-            img.save(img_stream, format="PNG")
-            img_stream.seek(0)
+            raw = image_file.read()
+            img = Image.open(BytesIO(raw))  # Lazy open: only the header is read
+
+            if img.format in ("PNG", "JPEG") and max(img.size) <= 400:
+                # Already a format fitz decodes natively and close to target
+                # size — embed as-is and let fitz scale into the Rect
+                img_stream = raw
+            else:
+                # Downscale in place before the single PNG encode
+                img.thumbnail((130, 130), Image.LANCZOS)
+                if img.mode not in ("RGB", "RGBA"):
+                    img = img.convert("RGB")
+                buffer = BytesIO()
+                img.save(buffer, format="PNG")
+                img_stream = buffer.getvalue()
 
-            x0, y0, x1, y1 = image_positions[i - 1]
             template[0].insert_image(fitz.Rect(x0, y0, x1, y1), stream=img_stream)
 
             description = form_data.get(f"Scope {i} Description", "")
@@ -372,41 +472,29 @@ def merge_pdfs_with_images(overlay_pdf, template_path, output_temp_path, files,
             location = form_data.get(f"Scope {i} Location", "")
             status = form_data.get(f"Scope {i} Status", "")
             if location:
-                template[0].insert_text(scope_text_positions[i - 1]["location"], location, fontsize=8)
+                template[0].insert_text(_SCOPE_TEXT[i - 1]["location"], location, fontsize=8)
             if status:
-                template[0].insert_text(scope_text_positions[i - 1]["status"], status, fontsize=8)
-
-    template.save(output_temp_path)
-    template.close()
-
-def add_signatures_to_pdf(pdf_path, output_path, reported_by_signature, client_signature):
-    """Adds 'Reported by' and 'Client's Signature' images to the PDF at specific locations."""
-
-    # Save signatures as PNGs with transparent backgrounds
-    reported_by_path = save_signature_image(reported_by_signature, "reported_by.png")
-    client_signature_path = save_signature_image(client_signature, "client_signature.png")
+                template[0].insert_text(_SCOPE_TEXT[i - 1]["status"], status, fontsize=8)
 
-    print(f"Reported By Signature Path: {reported_by_path}")  # Debug statement
-    print(f"Client Signature Path: {client_signature_path}")  # Debug statement
-
-    # Open the existing PDF
-    doc = fitz.open(pdf_path)
+    # Decode signatures into transparent PNG bytes, no disk round-trip
+    reported_by_png = decode_signature_image(reported_by_signature, "reported_by")
+    client_signature_png = decode_signature_image(client_signature, "client_signature")
 
     # Define the coordinates for the signatures
     reported_by_position = (370, 560, 480, 770)  # Coordinates for 'Reported by' signature
     client_signature_position = (460, 640, 590, 700)  # Coordinates for 'Client's Signature'
 
     # Insert "Reported by" signature
-    if reported_by_path:
-        doc[0].insert_image(fitz.Rect(*reported_by_position), filename=reported_by_path)
+    if reported_by_png:
+        template[0].insert_image(fitz.Rect(*reported_by_position), stream=reported_by_png)
 
     # Insert "Client's Signature"
-    if client_signature_path:
-        doc[0].insert_image(fitz.Rect(*client_signature_position), filename=client_signature_path)
+    if client_signature_png:
+        template[0].insert_image(fitz.Rect(*client_signature_position), stream=client_signature_png)
 
-    # Save the PDF with the signatures to the final output path
-    doc.save(output_path)
-    doc.close()
+    # Save the finished report in a single pass
+    template.save(output_path)
+    template.close()
 
 
 
@@ -0,0 +1,46 @@
+import os  # For locating technicians.json relative to this file
+import threading  # Lock for the technician cache (Flask servers are threaded)
+import orjson  # Fast JSON serialization (returns/accepts bytes directly)
+
+# Path to technician data JSON file (anchored here so it works from any cwd)
+TECHNICIAN_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "admin_page", "technicians.json")
+
+# In-memory cache for technician data, invalidated when the file's mtime changes.
+# Shared by app.py and admin.py so admin-side edits are visible to the form side.
+_tech_cache = {"mtime": None, "data": []}
+_tech_cache_lock = threading.Lock()
+
+
+def load_technicians():
+    """Load technician data from the JSON file (cached until the file changes)."""
+    try:
+        st = os.stat(TECHNICIAN_FILE)
+    except FileNotFoundError:
+        print("technicians.json not found!")  # Debug log
+        return []
+    with _tech_cache_lock:
+        if st.st_mtime_ns == _tech_cache["mtime"]:
+            return _tech_cache["data"]
+        try:
+            with open(TECHNICIAN_FILE, "rb") as file:
+                data = orjson.loads(file.read())
+        except FileNotFoundError:
+            print("technicians.json not found!")  # Debug log
+            return []
+        technicians = data.get("technicians", [])
+        print("Loaded Technicians:", technicians)  # Debug log
+        _tech_cache["mtime"] = st.st_mtime_ns
+        _tech_cache["data"] = technicians
+        return technicians
+
+
+def save_technicians(technicians):
+    """Save the list of technicians to the JSON file."""
+    # Serialize in memory first so the file sees one buffered write.
+    # Compact encoding — the file is machine-read only, so no indentation
+    payload = orjson.dumps({"technicians": technicians})
+    with open(TECHNICIAN_FILE, "wb") as file:
+        file.write(payload)
+    with _tech_cache_lock:
+        _tech_cache["mtime"] = None  # Force a re-read on next load
+    print("Saved Technicians:", technicians)  # Debug log